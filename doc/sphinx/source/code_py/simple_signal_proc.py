@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 
 def create_1D_rect(n):
@@ -9,9 +8,8 @@ def create_1D_rect(n):
 
 
 def sinc(x, dtype=np.float32):
-    no_matter_value = 30
     N = x.size
-    sincx = no_matter_value*np.ones(N, dtype=dtype)
+    sincx = np.empty(N, dtype=dtype)
     sincx[0:N/2] = np.sin(x[0:N/2]*np.pi)/(x[0:N/2]*np.pi)
     sincx[N/2] = 1
     sincx[N/2+1:sincx.size] = np.sin(x[N/2+1:N]*np.pi)/(x[N/2+1:N]*np.pi)
@@ -25,10 +23,7 @@ def create_1D_sinc(n, step=1):
 
 def create_1D_lanczos(n, a=3, step=1):
     x, sincx = create_1D_sinc(n, step)
-    sincx_a = sinc(x/a)
-    rect_lanczos = np.zeros(sincx_a.size)
-    rect_lanczos[np.where((-a<x)*(x<a))] = 1
-    return x,sincx*sincx_a*rect_lanczos
+    return x, np.where(np.abs(x)<a, sincx.astype(np.float64)*sinc(x/a), 0.)
 
 
 def create_1D_mire(n):
@@ -54,6 +49,8 @@ def create_1D_ramp(n=100,step=1):
 
 
 def show_1D(signal, title='Figure'):
+    import matplotlib.pyplot as plt
+
     plt.plot(signal)
     plt.title(title)
     plt.show()
@@ -170,7 +167,7 @@ def interp1d(signal, zoom_factor):
     # Calcul de la dimension de l'image cible
     n = signal.size
     N = n*zoom_factor
-    zoomed_signal = np.ones((N), dtype=np.complex)
+    zoomed_signal = np.empty((N), dtype=np.complex)
 
     # Pour chaque partie fractionnaire possible,
     # calcul du noyau de convolution lineaire et ajout d'une marge au signal
@@ -191,7 +188,6 @@ def zoom_freq_img_perAndSmooth(signal, zoom_factor):
     n = signal.size
     # Etape 1 : Calcul de la partie lisse (s) de l'image
     x = np.arange(n)
-    s = np.zeros(signal.shape)
     s = ((signal[n-1] - signal[0])/np.float(n)) * (x - (n-1)/2)
 
     # Etape 2 : Calcul de la partie periodique de l'image
@@ -38,8 +38,6 @@ namespace sirius {
 Image ZoomFilterImageToInputResolution(const Image& filter_image,
                                        const ZoomRatio& zoom_ratio);
 
-void NormalizeFilterImage(Image& filter_image, int oversampling);
-
 Image FrequencyShift(const Image& filter_image, const Point& hot_point,
                      float shift_col, float shift_row);
 
@@ -299,27 +297,36 @@ Image ZoomFilterImageToInputResolution(const Image& filter_image,
 void NormalizeFilterImage(Image& filter_image, int oversampling) {
     LOG("filter", trace, "normalize zoomed filter");
 
-    // iterate over sub filters
-    for (int i = 0; i < oversampling; ++i) {
+    const int col_count = filter_image.size.col;
+
+    // calculate sum of each sub filter in a single pass over the image
+    std::vector<double> sums(oversampling * oversampling, 0);
+    for (int row = 0; row < filter_image.size.row; ++row) {
+        double* sub_filter_sums =
+              sums.data() + (row % oversampling) * oversampling;
+        const double* row_data = filter_image.data.data() + row * col_count;
         for (int j = 0; j < oversampling; ++j) {
-            // calculate sum of each point for the current sub filter
-            double sum = 0;
-            for (int row = i; row < filter_image.size.row;
-                 row += oversampling) {
-                for (int col = j; col < filter_image.size.col;
-                     col += oversampling) {
-                    sum += filter_image.data[row * filter_image.size.col + col];
-                }
+            double sum = sub_filter_sums[j];
+            for (int col = j; col < col_count; col += oversampling) {
+                sum += row_data[col];
             }
+            sub_filter_sums[j] = sum;
+        }
+    }
 
-            // normalize each point of the current sub filter
-            for (int row = i; row < filter_image.size.row;
-                 row += oversampling) {
-                for (int col = j; col < filter_image.size.col;
-                     col += oversampling) {
-                    filter_image.data[row * filter_image.size.col + col] /=
-                          oversampling * oversampling * sum;
-                }
+    for (auto& sum : sums) {
+        sum *= oversampling * oversampling;
+    }
+
+    // normalize each point with the sum of its sub filter
+    for (int row = 0; row < filter_image.size.row; ++row) {
+        const double* sub_filter_sums =
+              sums.data() + (row % oversampling) * oversampling;
+        double* row_data = filter_image.data.data() + row * col_count;
+        for (int j = 0; j < oversampling; ++j) {
+            const double sum = sub_filter_sums[j];
+            for (int col = j; col < col_count; col += oversampling) {
+                row_data[col] /= sum;
             }
         }
     }
@@ -174,6 +174,14 @@ class Filter {
     FilterFFTCacheUPtr filter_fft_cache_{nullptr};
 };
 
+/**
+ * \brief Normalize each sub filter of an oversampled filter image so that its
+ *        values sum to 1 / (oversampling * oversampling)
+ * \param filter_image filter image to normalize in place
+ * \param oversampling oversampling factor of the filter image
+ */
+void NormalizeFilterImage(Image& filter_image, int oversampling);
+
 }  // namespace sirius
 
 #endif  // SIRIUS_FILTER_H_
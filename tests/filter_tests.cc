@@ -100,3 +100,53 @@ TEST_CASE("filter - sinc2 filter", "[sirius]") {
         REQUIRE_NOTHROW(filter.Process(size, std::move(complex_array)));
     }
 }
+
+TEST_CASE("filter - normalize filter image", "[sirius]") {
+    LOG_SET_LEVEL(trace);
+    sirius::Size size = {13, 17};
+    sirius::Image filter_image(size);
+    for (int i = 0; i < filter_image.CellCount(); ++i) {
+        filter_image.data[i] = 1.0 + (i * 37 % 101) / 7.0;
+    }
+
+    for (int oversampling = 1; oversampling <= 5; ++oversampling) {
+        // reference normalization: one strided pass per sub filter
+        sirius::Image expected_image = filter_image;
+        for (int i = 0; i < oversampling; ++i) {
+            for (int j = 0; j < oversampling; ++j) {
+                double sum = 0;
+                for (int row = i; row < size.row; row += oversampling) {
+                    for (int col = j; col < size.col; col += oversampling) {
+                        sum += expected_image.data[row * size.col + col];
+                    }
+                }
+                for (int row = i; row < size.row; row += oversampling) {
+                    for (int col = j; col < size.col; col += oversampling) {
+                        expected_image.data[row * size.col + col] /=
+                              oversampling * oversampling * sum;
+                    }
+                }
+            }
+        }
+
+        sirius::Image normalized_image = filter_image;
+        sirius::NormalizeFilterImage(normalized_image, oversampling);
+
+        for (int i = 0; i < normalized_image.CellCount(); ++i) {
+            REQUIRE(normalized_image.data[i] == expected_image.data[i]);
+        }
+
+        for (int i = 0; i < oversampling; ++i) {
+            for (int j = 0; j < oversampling; ++j) {
+                double sum = 0;
+                for (int row = i; row < size.row; row += oversampling) {
+                    for (int col = j; col < size.col; col += oversampling) {
+                        sum += normalized_image.data[row * size.col + col];
+                    }
+                }
+                REQUIRE(sum ==
+                        Approx(1.0 / (oversampling * oversampling)));
+            }
+        }
+    }
+}